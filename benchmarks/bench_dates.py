@@ -0,0 +1,79 @@
+"""
+Compare `format_date` applied value by value with `DateNormalizer` on a
+catalogue-like column: a few hundred distinct dates repeated many times.
+
+    python benchmarks/bench_dates.py --values 100000 --distinct 300
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from dates import DateNormalizer, format_date  # noqa: E402
+
+
+def make_dates(values, distinct, seed=0):
+    """
+    Mostly day-first dates with some ISO-ish and unparseable ones mixed in.
+    """
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(distinct):
+        y, m, d = rng.randint(1950, 2026), rng.randint(1, 12), rng.randint(1, 28)
+        pool.append(
+            rng.choices(
+                [f"{d}/{m}/{y}", f"{y}-{m}-{d}", f"{d}.{m}.{y}", f"{y}/{d}/{m}", "c. 1990", ""],
+                weights=[70, 15, 8, 4, 2, 1],
+            )[0]
+        )
+    return pd.Series([rng.choice(pool) for _ in range(values)], dtype=object)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--values", type=int, default=100000)
+    parser.add_argument("--distinct", type=int, default=300)
+    args = parser.parse_args()
+
+    dates = make_dates(args.values, args.distinct)
+
+    expected, plain_s = timed(lambda: dates.map(format_date))
+
+    normalizer = DateNormalizer()
+    cold, cold_s = timed(lambda: normalizer.normalize_series(dates))
+    warm, warm_s = timed(lambda: normalizer.normalize_series(dates))
+
+    assert cold.equals(expected) and warm.equals(expected)
+
+    print(
+        json.dumps(
+            {
+                "values": args.values,
+                "distinct": args.distinct,
+                "format_date_s": round(plain_s, 4),
+                "normalizer_cold_s": round(cold_s, 4),
+                "normalizer_warm_s": round(warm_s, 4),
+                "speedup_cold": round(plain_s / cold_s, 1),
+                "cache": normalizer.cache_info()._asdict(),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measure cold-start cost: the time for a fresh interpreter to import the
+app, and the extra time paid later by the first upload and download.
+
+    python benchmarks/bench_import.py --runs 10
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import app
+app_s = time.perf_counter() - start
+heavy = [name for name in ("pandas", "reportlab", "pypdf") if name in sys.modules]
+start = time.perf_counter()
+import ingest, pdf_render
+deferred_s = time.perf_counter() - start
+print(json.dumps({"app_s": app_s, "deferred_s": deferred_s, "heavy": heavy}))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = []
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=SRC,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print(
+        json.dumps(
+            {
+                "runs": args.runs,
+                "import_app_ms": round(statistics.median(r["app_s"] for r in runs) * 1000, 1),
+                "first_use_ms": round(
+                    statistics.median(r["deferred_s"] for r in runs) * 1000, 1
+                ),
+                "heavy_modules_at_import": runs[0]["heavy"],
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
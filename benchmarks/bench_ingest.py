@@ -0,0 +1,144 @@
+"""
+Time CSV ingestion on messy catalogue exports: the row-by-row loader the
+app used to run against the streaming, column-wise `ingest.read_frame`.
+
+    python benchmarks/bench_ingest.py --rows 1000 50000
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import argparse
+import tempfile
+import tracemalloc
+from collections import Counter
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from dates import format_date  # noqa: E402
+from ingest import read_frame  # noqa: E402
+from card_store import FIELDS, CardStore  # noqa: E402
+
+SEPARATORS = [",", "，", ";", "\t", ", "]
+TITLES = ["天使與惡魔（改編拉斐爾 小天使）", "小天使", "Sunset", "River Study", "山水（局部）"]
+DATES = ["2024/5/20", "2024-20-5", "2025/01/03", "20.5.2024", "5/20/2024", ""]
+
+
+def write_messy_csv(path, rows, seed=0):
+    """
+    Write a CSV mixing every delimiter and the full-width punctuation
+    seen in real uploads. Each line uses a single delimiter throughout.
+    """
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# comment\n")
+        f.write("title,author,height,width,medium,date\n")
+        for _ in range(rows):
+            sep = rng.choice(SEPARATORS)
+            fields = [
+                rng.choice(TITLES),
+                "李皓瑋",
+                str(rng.randint(10, 200)),
+                str(rng.randint(10, 200)),
+                "壓克力",
+                rng.choice(DATES),
+            ]
+            f.write(sep.join(fields) + "\n")
+
+
+def legacy_load(path):
+    """
+    The loader as it was: whole-file string rewriting and iterrows.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+        content = (
+            content.replace("，", ",")
+            .replace(";", ",")
+            .replace("\t", ",")
+            .replace(", ", ",")
+        )
+        content = content.replace("（", " (").replace("）", ") ")
+        df = pd.read_csv(io.StringIO(content), delimiter=",", comment="#")
+
+    df = df.fillna("")
+    data = {}
+    for _, row in df.iterrows():
+        cid = str(uuid.uuid4())[:8]
+        data[cid] = {
+            "title": str(row.get("title", "")),
+            "height": str(row.get("height", "")),
+            "width": str(row.get("width", "")),
+            "medium": str(row.get("medium", "")),
+            "date": format_date(str(row.get("date", ""))),
+            "comments": str(row.get("comments", "")),
+        }
+    return data
+
+
+def columnar_load(path):
+    """
+    The loader as the app runs it: `read_frame`, then the columns into a
+    CardStore. Returned as {card id: card} to compare with `legacy_load`.
+    """
+    df = read_frame(path)
+    cards = CardStore()
+    cards.add_columns({field: df[field].tolist() for field in FIELDS})
+    return dict(cards.items())
+
+
+def measure(fn, path):
+    start = time.perf_counter()
+    data = fn(path)
+    elapsed = time.perf_counter() - start
+
+    # Separate run for memory, since tracing skews the timing
+    tracemalloc.start()
+    fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return data, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 50000])
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, f"catalogue-{rows}.csv")
+            write_messy_csv(path, rows)
+
+            old, old_s, old_peak = measure(legacy_load, path)
+            new, new_s, new_peak = measure(columnar_load, path)
+
+            # Ids are random, and the legacy loader can lose a card when two
+            # 8-character ids collide; every card it kept must match
+            missing = Counter(map(repr, old.values())) - Counter(map(repr, new.values()))
+            assert not missing and len(new) == rows
+
+            results.append(
+                {
+                    "rows": rows,
+                    "legacy_s": round(old_s, 4),
+                    "columnar_s": round(new_s, 4),
+                    "speedup": round(old_s / new_s, 1),
+                    "legacy_peak_mb": round(old_peak / 2**20, 1),
+                    "columnar_peak_mb": round(new_peak / 2**20, 1),
+                }
+            )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Time a re-download after fixing one typo, with and without the page
+cache, including a fresh process reading the cache back from disk.
+
+    python benchmarks/bench_page_cache.py --labels 10000
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from bench_pdf_stream import make_cards  # noqa: E402
+from page_cache import PageCache  # noqa: E402
+from pdf_render import write_pdf  # noqa: E402
+
+
+def timed(cards_data, cache=None):
+    start = time.perf_counter()
+    write_pdf(cards_data, io.BytesIO(), cache)
+    return round(time.perf_counter() - start, 4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--labels", type=int, default=10000)
+    args = parser.parse_args()
+
+    cards_data = make_cards(args.labels)
+    edited = list(cards_data)
+    edited[len(edited) // 2] = dict(edited[len(edited) // 2], title="typo fixed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageCache(directory=tmp)
+        results = {
+            "labels": args.labels,
+            "uncached_s": timed(edited),
+            "cold_cache_s": timed(cards_data, cache),
+            "after_edit_s": timed(edited, cache),
+        }
+        results["memory_cache"] = cache.stats()
+
+        # A new process starts with an empty memory cache
+        restarted = PageCache(directory=tmp)
+        results["from_disk_s"] = timed(edited, restarted)
+        results["disk_cache"] = restarted.stats()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Measure PDF export throughput against the number of worker processes.
+
+    python benchmarks/bench_pdf_parallel.py --labels 10000 --jobs 1 2 4 8
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from bench_pdf_stream import make_cards  # noqa: E402
+from pdf_render import write_pdf, write_pdf_parallel  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--labels", type=int, default=10000)
+    parser.add_argument(
+        "--jobs", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1})
+    )
+    args = parser.parse_args()
+
+    cards_data = make_cards(args.labels)
+    results = []
+
+    for jobs in args.jobs:
+        buffer = io.BytesIO()
+        start = time.perf_counter()
+        if jobs == 1:
+            write_pdf(cards_data, buffer)
+        else:
+            write_pdf_parallel(cards_data, buffer, jobs)
+        elapsed = time.perf_counter() - start
+
+        results.append(
+            {
+                "jobs": jobs,
+                "labels": args.labels,
+                "bytes": buffer.tell(),
+                "total_s": round(elapsed, 4),
+                "labels_per_s": round(args.labels / elapsed, 1),
+            }
+        )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Compare the size and render time of the standard PDF with the
+optimized one (`optimize=True`) on a large generated CJK catalogue.
+
+Each mode runs in its own process so the peak RSS numbers are not
+polluted by the other run.
+
+    python benchmarks/bench_pdf_size.py --rows 10000 100000
+"""
+
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from catalogue import write_catalogue  # noqa: E402
+
+MODES = ("standard", "optimized")
+
+
+def run(mode, path, jobs):
+    from cli import read_records
+    from pdf_render import write_pdf_parallel
+
+    cards_data = read_records(path)
+    out = path + f".{mode}.pdf"
+
+    start = time.perf_counter()
+    write_pdf_parallel(cards_data, out, jobs, optimize=mode == "optimized")
+    total = time.perf_counter() - start
+
+    with open(out, "rb") as f:
+        data = f.read()
+    os.remove(out)
+
+    # ru_maxrss is KiB on Linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "mode": mode,
+        "labels": len(cards_data),
+        "jobs": jobs,
+        "bytes": len(data),
+        "font_programs": data.count(b"/FontFile2"),
+        "total_s": round(total, 4),
+        "peak_rss_mb": round(rss / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000])
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--mode", choices=MODES)
+    parser.add_argument("--csv")
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run(args.mode, args.csv, args.jobs)))
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, f"catalogue-{rows}.csv")
+            write_catalogue(path, rows)
+
+            runs = {}
+            for mode in MODES:
+                out = subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--mode",
+                        mode,
+                        "--csv",
+                        path,
+                        "--jobs",
+                        str(args.jobs),
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+                runs[mode] = json.loads(out.stdout)
+                results.append(runs[mode])
+
+            standard, optimized = runs["standard"], runs["optimized"]
+            results.append(
+                {
+                    "labels": rows,
+                    "size_ratio": round(optimized["bytes"] / standard["bytes"], 3),
+                    "time_ratio": round(optimized["total_s"] / standard["total_s"], 3),
+                }
+            )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Compare the streamed PDF download (`iter_pdf`) with rendering the whole
+document into one bytes buffer: time to the first byte, total time and
+peak RSS. The streamed download should send its first byte after one
+run of pages and keep a flat peak RSS as the label count grows.
+
+Each mode runs in its own process so the peak RSS numbers are not
+polluted by the other run.
+
+    python benchmarks/bench_pdf_stream.py --labels 1000 10000 50000
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+def make_cards(n):
+    return [
+        {
+            "title": f"天使與惡魔 {i}",
+            "height": "30",
+            "width": "40",
+            "medium": "壓克力",
+            "date": "2024/05/20",
+            "comments": "私人收藏" if i % 3 else "",
+        }
+        for i in range(n)
+    ]
+
+
+def run(mode, labels):
+    from pdf_render import iter_pdf, write_pdf
+
+    cards_data = make_cards(labels)
+    # The cards alone grow with the label count; report the rest apart
+    # ru_maxrss is KiB on Linux
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    first = None
+    size = 0
+
+    if mode == "buffer":
+        buffer = io.BytesIO()
+        write_pdf(cards_data, buffer)
+        buffer.seek(0)
+        chunks = [buffer.read()]
+    else:
+        chunks = iter_pdf(cards_data, jobs=1)
+
+    for chunk in chunks:
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+
+    total = time.perf_counter() - start
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "mode": mode,
+        "labels": labels,
+        "bytes": size,
+        "first_byte_s": round(first, 4),
+        "total_s": round(total, 4),
+        "peak_rss_mb": round(rss / 1024, 1),
+        "render_rss_mb": round((rss - base) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--labels", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--mode", choices=["buffer", "stream"])
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run(args.mode, args.labels[0])))
+        return
+
+    results = []
+    for labels in args.labels:
+        for mode in ("buffer", "stream"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--labels", str(labels)],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            results.append(json.loads(out.stdout))
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Time and measure memory for the three hot paths of a session on
+synthetic catalogues: CSV ingestion (`load_csv`), preview construction
+(`_sync_preview`) and PDF export (`download_pdf`,
+standard and with "Smaller PDF" ticked).
+
+Each stage runs in its own process on the same generated CSV, so one
+stage's allocations do not show up in the next one's numbers. Results
+are written as JSON; pass an earlier result file as `--baseline` to
+fail on regressions.
+
+    python benchmarks/bench_suite.py --out results.json
+    python benchmarks/bench_suite.py --rows 100 10000 --baseline results.json
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import platform
+import argparse
+import tempfile
+import resource
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from catalogue import SIZES, write_catalogue  # noqa: E402
+
+STAGES = ("ingest", "preview", "export", "export_optimized")
+
+# Changes smaller than this are noise, whatever the tolerance says
+NOISE = {"seconds": 0.01, "peak_rss_growth_mb": 2.0}
+
+
+def ingest(path):
+    from ingest import read_frame
+    from card_store import FIELDS, CardStore
+
+    def stage():
+        cards = CardStore()
+        df = read_frame(path)
+        cards.add_columns({field: df[field].tolist() for field in FIELDS})
+        return len(cards)
+
+    return stage
+
+
+def preview(path):
+    from app import card_ui
+    from ingest import read_frame
+    from layout import CARDS_PER_PAGE
+    from card_store import FIELDS, CardStore
+
+    cards = CardStore()
+    df = read_frame(path)
+    cards.add_columns({field: df[field].tolist() for field in FIELDS})
+    del df
+
+    def stage():
+        # What the session sends after an upload: the first sheet of cards
+        sheet = [card_ui(cid, cards.get(cid)) for cid in cards.page(0, CARDS_PER_PAGE)]
+        html = "".join(str(card) for card in sheet)
+        return len(html)
+
+    return stage
+
+
+def export(path, optimize=False):
+    from ingest import read_frame
+    from card_store import FIELDS
+    from page_cache import PageCache
+    from pdf_render import aiter_pdf
+
+    cards_data = read_frame(path)[list(FIELDS)].to_dict("records")
+
+    async def download():
+        # As download_pdf runs it, but with an empty page cache each
+        # time, as on the first download of these cards. Rendered in this
+        # process, as the peak RSS only covers this process and not the
+        # pool workers the app would use for large runs.
+        size = 0
+        async for chunk in aiter_pdf(cards_data, jobs=1, cache=PageCache(), optimize=optimize):
+            size += len(chunk)
+        return size
+
+    def stage():
+        return asyncio.run(download())
+
+    return stage
+
+
+def export_optimized(path):
+    return export(path, optimize=True)
+
+
+def rss_mb(field):
+    """
+    Current (VmRSS) or peak (VmHWM) resident memory from /proc, or the
+    peak from getrusage where /proc is not available.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 2**20 if sys.platform == "darwin" else rss / 1024
+
+
+def reset_peak_rss():
+    # Linux only: restart VmHWM from the current RSS
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def run(stage_name, path, repeat):
+    """
+    Run one stage in this process and keep the best of `repeat` runs.
+    Memory is the growth of peak RSS over the RSS before the first run,
+    after the stage's input has been loaded. `output` is what the stage
+    produced (cards, characters or bytes), to spot a run that did less.
+    """
+    stage = globals()[stage_name](path)
+
+    reset_peak_rss()
+    before = rss_mb("VmRSS")
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = stage()
+        times.append(time.perf_counter() - start)
+
+    return {
+        "seconds": round(min(times), 4),
+        "peak_rss_growth_mb": round(max(rss_mb("VmHWM") - before, 0), 1),
+        "output": output,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Stages slower or hungrier than in `baseline` by more than
+    `tolerance`, as printable lines.
+    """
+    before = {(r["stage"], r["rows"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = before.get((result["stage"], result["rows"]))
+        if old is None or old["sha256"] != result["sha256"]:
+            continue
+        for metric, noise in NOISE.items():
+            limit = max(old[metric] * (1 + tolerance), old[metric] + noise)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{result['stage']} @ {result['rows']} rows: {metric} "
+                    f"{old[metric]} -> {result[metric]}"
+                )
+    return regressions
+
+
+def git_revision():
+    try:
+        out = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage, best kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="earlier results to check for regressions")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown or memory growth over the baseline (default: 0.25)",
+    )
+    parser.add_argument("--stage", choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument("--csv", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.stage:
+        print(json.dumps(run(args.stage, args.csv, args.repeat)))
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, f"catalogue-{rows}.csv")
+            digest = write_catalogue(path, rows, args.seed)
+            for stage in args.stages:
+                out = subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--stage",
+                        stage,
+                        "--csv",
+                        path,
+                        "--repeat",
+                        str(args.repeat),
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+                result = {"stage": stage, "rows": rows, "sha256": digest}
+                result.update(json.loads(out.stdout))
+                results.append(result)
+                print(json.dumps(result), file=sys.stderr)
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"regression: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Generate synthetic catalogue CSVs shaped like real uploads: CJK titles
+and media, every delimiter the app accepts, full-width punctuation and
+each supported date format (plus a few it has to pass through).
+
+The output depends only on the row count and the seed, so benchmark
+runs on different machines or versions read the same bytes.
+
+    python benchmarks/catalogue.py 100 10000 100000 --out-dir data
+"""
+
+import os
+import random
+import hashlib
+import argparse
+
+SIZES = (100, 10_000, 100_000)
+
+# Every delimiter the upload accepts; a line uses one throughout
+SEPARATORS = [",", "，", ";", "\t", ", "]
+
+SUBJECTS = ["天使與惡魔", "小天使", "山水", "秋日午後", "海邊的窗", "母與子", "靜物", "自畫像", "Sunset", "River Study"]
+DETAILS = ["（局部）", "（改編拉斐爾 小天使）", "（習作）", "（二）", "", "", ""]
+SERIES = ["系列「光」", "No.", "之", ""]
+MEDIA = ["壓克力", "油彩", "水彩", "墨、紙本", "複合媒材", "Oil on canvas", "炭筆"]
+COMMENTS = ["", "", "", "私人收藏", "展覽：二〇二四年春季展", "借展", "「非賣品」", "已售出"]
+
+# (strftime-style format, share of rows): the formats DateNormalizer
+# reads, plus dates it cannot parse and empty ones
+DATE_FORMATS = [
+    ("%Y/%m/%d", 4),
+    ("%Y/%-m/%-d", 2),
+    ("%Y/%d/%m", 1),
+    ("%d/%m/%Y", 1),
+    ("%m/%d/%Y", 1),
+    ("%Y-%m-%d", 1),
+    ("%Y年%m月%d日", 1),
+    ("", 1),
+]
+
+
+def random_date(rng):
+    fmt = rng.choices([f for f, _ in DATE_FORMATS], [w for _, w in DATE_FORMATS])[0]
+    if not fmt:
+        return ""
+    year, month, day = rng.randint(1990, 2025), rng.randint(1, 12), rng.randint(1, 28)
+    # %-m is not portable, so fill the fields in by hand
+    return (
+        fmt.replace("%Y", str(year))
+        .replace("%-m", str(month))
+        .replace("%-d", str(day))
+        .replace("%m", f"{month:02d}")
+        .replace("%d", f"{day:02d}")
+    )
+
+
+def random_title(rng, i):
+    series = rng.choice(SERIES)
+    if series in ("No.", "之"):
+        series = f"{series}{i % 97 + 1}"
+    return f"{rng.choice(SUBJECTS)}{series}{rng.choice(DETAILS)}"
+
+
+def write_catalogue(path, rows, seed=0):
+    """
+    Write `rows` cards to `path` and return the file's SHA-256.
+    """
+    rng = random.Random(f"{seed}-{rows}")
+    digest = hashlib.sha256()
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        lines = ["# synthetic catalogue\n", "title,height,width,medium,date,comments\n"]
+        for i in range(rows):
+            sep = rng.choice(SEPARATORS)
+            fields = [
+                random_title(rng, i),
+                str(rng.randint(10, 200)),
+                str(rng.randint(10, 200)),
+                rng.choice(MEDIA),
+                random_date(rng),
+                rng.choice(COMMENTS),
+            ]
+            lines.append(sep.join(fields) + "\n")
+            if len(lines) >= 10_000:
+                text = "".join(lines)
+                f.write(text)
+                digest.update(text.encode("utf-8"))
+                lines = []
+        text = "".join(lines)
+        f.write(text)
+        digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("rows", type=int, nargs="*", default=list(SIZES))
+    parser.add_argument("--out-dir", default=".")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for rows in args.rows:
+        path = os.path.join(args.out_dir, f"catalogue-{rows}.csv")
+        print(path, write_catalogue(path, rows, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import io
+import os
+import hashlib
+import threading
+from reportlab.pdfbase import pdfmetrics
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.ttfonts import TTFont
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+font_path = os.path.join(BASE_DIR, "fonts", "NotoSansTC-Regular.ttf")
+
+FONT_NAME = "NotoSansTC"
+HEADER_FORM = "header"
+
+# Served to the browser from www/ and embedded in the PDF
+header_path = os.path.join(BASE_DIR, "www", "header.png")
+
+# Process-wide cache: every session and every download shares these
+_lock = threading.Lock()
+_font_registered = False
+_header_bytes = None
+_header_image = None
+
+
+def register_font():
+    """
+    Register the label font with reportlab the first time it is needed.
+    Later calls are a no-op, so the TTF is parsed once per process.
+    """
+    global _font_registered
+    if _font_registered:
+        return FONT_NAME
+
+    with _lock:
+        if not _font_registered:
+            pdfmetrics.registerFont(TTFont(FONT_NAME, font_path))
+            _font_registered = True
+
+    return FONT_NAME
+
+
+def header_bytes():
+    """
+    Return the header PNG, read from disk the first time it is needed.
+    Returns b"" if there is no header image.
+    """
+    global _header_bytes
+    if _header_bytes is None:
+        try:
+            with open(header_path, "rb") as f:
+                _header_bytes = f.read()
+        except FileNotFoundError:
+            _header_bytes = b""
+    return _header_bytes
+
+
+def header_image():
+    """
+    Return the decoded header as an ImageReader, decoding it only once.
+    Returns None if there is no header image.
+    """
+    global _header_image
+    if _header_image is not None or not header_bytes():
+        return _header_image
+
+    with _lock:
+        if _header_image is None:
+            _header_image = ImageReader(io.BytesIO(header_bytes()))
+
+    return _header_image
+
+
+def asset_fingerprint():
+    """
+    Identifies the font and header image, so cached layouts made with
+    different assets are never reused.
+    """
+    stat = os.stat(font_path)
+    header = hashlib.sha256(header_bytes()).hexdigest()
+    return [FONT_NAME, stat.st_size, stat.st_mtime_ns, header]
+
+
+def draw_header(c, x, top, width):
+    """
+    Draw the header scaled to `width` with its top-left corner at (x, top),
+    returning the drawn height.
+
+    The image is stored once per document as a form XObject and every
+    card references it, so file size does not grow with the card count.
+    """
+    img = header_image()
+    if img is None:
+        return 0
+
+    img_width, img_height = img.getSize()
+    height = img_height * width / img_width
+
+    if not c.hasForm(HEADER_FORM):
+        c.beginForm(HEADER_FORM, upperx=img_width, uppery=img_height)
+        c.drawImage(img, 0, 0, img_width, img_height)
+        c.endForm()
+
+    c.saveState()
+    c.translate(x, top - height)
+    c.scale(width / img_width, width / img_width)
+    c.doForm(HEADER_FORM)
+    c.restoreState()
+
+    return height
@@ -0,0 +1,148 @@
+import os
+import itertools
+from collections import namedtuple
+
+FIELDS = ("title", "height", "width", "medium", "date", "comments")
+
+# What a mutation did to the store: ids added and removed, in order
+CardChange = namedtuple("CardChange", ["version", "added", "removed"])
+
+
+def new_ids(n, taken=()):
+    """
+    Return `n` distinct 8-character hex card ids not already in `taken`.
+    """
+    ids = []
+    # Only this batch is copied; `taken` is checked in place
+    batch = set()
+    while len(ids) < n:
+        missing = n - len(ids)
+        raw = os.urandom(4 * missing).hex()
+        for i in range(0, len(raw), 8):
+            cid = raw[i : i + 8]
+            if cid not in taken and cid not in batch:
+                batch.add(cid)
+                ids.append(cid)
+    return ids
+
+
+class CardStore:
+    """
+    Ordered card collection stored column-wise.
+
+    Each field is one list indexed by slot, so adding cards appends to the
+    columns and deleting marks the slot empty; both are O(1) per card. The
+    empty slots are dropped once they make up half the store. Every
+    mutation returns a `CardChange` describing it.
+    """
+
+    __slots__ = ("_ids", "_columns", "_slots", "_holes", "_version")
+
+    def __init__(self):
+        self._ids = []
+        self._columns = {field: [] for field in FIELDS}
+        self._slots = {}
+        self._holes = 0
+        self._version = 0
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, cid):
+        return cid in self._slots
+
+    def __iter__(self):
+        return (cid for cid in self._ids if cid is not None)
+
+    def get(self, cid):
+        """
+        Return the card with id `cid` as a dict.
+        """
+        slot = self._slots[cid]
+        return {field: column[slot] for field, column in self._columns.items()}
+
+    def items(self):
+        for cid in self:
+            yield cid, self.get(cid)
+
+    def column(self, field):
+        """
+        (id, value) pairs of one field for every card, in order.
+        """
+        values = self._columns[field]
+        return ((cid, values[slot]) for slot, cid in enumerate(self._ids) if cid is not None)
+
+    def records(self):
+        """
+        Every card as a list of dicts, in order.
+        """
+        live = [slot for slot, cid in enumerate(self._ids) if cid is not None]
+        columns = [[column[slot] for slot in live] for column in self._columns.values()]
+        return [dict(zip(FIELDS, row)) for row in zip(*columns)]
+
+    def add(self, card, count=1):
+        """
+        Append `count` copies of `card`.
+        """
+        return self.add_columns({field: [card.get(field, "")] * count for field in FIELDS})
+
+    def add_columns(self, columns):
+        """
+        Append cards given as {field: list of values}; missing fields are
+        left empty. Every given list must have the same length.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"columns have different lengths: {sorted(lengths)}")
+        n = lengths.pop() if lengths else 0
+        ids = new_ids(n, self._slots)
+
+        start = len(self._ids)
+        self._ids.extend(ids)
+        for field, column in self._columns.items():
+            column.extend(columns.get(field) or [""] * n)
+        self._slots.update(zip(ids, range(start, start + n)))
+
+        return self._changed(added=ids)
+
+    def remove(self, *cids):
+        """
+        Delete the cards with the given ids, ignoring unknown ones.
+        """
+        removed = []
+        for cid in cids:
+            slot = self._slots.pop(cid, None)
+            if slot is None:
+                continue
+            self._ids[slot] = None
+            for column in self._columns.values():
+                column[slot] = None
+            removed.append(cid)
+
+        self._holes += len(removed)
+        if self._holes > len(self._slots):
+            self._compact()
+
+        return self._changed(removed=removed)
+
+    def page(self, index, size):
+        """
+        Ids of the cards on page `index` when split into pages of `size`.
+        """
+        if not self._holes:
+            return self._ids[index * size : (index + 1) * size]
+
+        start = index * size
+        return list(itertools.islice(self, start, start + size))
+
+    def _compact(self):
+        live = [slot for slot, cid in enumerate(self._ids) if cid is not None]
+        self._ids = [self._ids[slot] for slot in live]
+        for field, column in self._columns.items():
+            self._columns[field] = [column[slot] for slot in live]
+        self._slots = {cid: slot for slot, cid in enumerate(self._ids)}
+        self._holes = 0
+
+    def _changed(self, added=(), removed=()):
+        self._version += 1
+        return CardChange(self._version, list(added), list(removed))
@@ -0,0 +1,140 @@
+"""
+Build print-ready label PDFs from CSV files without starting the app.
+
+    python src/cli.py inventory.csv
+    python src/cli.py exports/*.csv --out-dir pdfs --jobs 4
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from card_store import FIELDS
+from ingest import read_frame
+from instrumentation import count, stage
+from page_cache import CACHE_DIR_ENV, check_private, shared_cache
+from pdf_render import MP_CONTEXT, cache_fields, default_jobs, write_pdf, write_pdf_parallel
+
+
+def output_path(csv_path, out_dir=None):
+    """
+    `inventory.csv` -> `inventory.pdf`, next to the CSV or in `out_dir`.
+    """
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(out_dir or os.path.dirname(csv_path), f"{stem}.pdf")
+
+
+def read_records(csv_path):
+    """
+    Cards from a CSV, normalized exactly as the upload in the app.
+    """
+    df = read_frame(csv_path)
+    return df[list(FIELDS)].to_dict("records")
+
+
+def convert(csv_path, pdf_path, jobs=1, cached=False, optimize=False):
+    """
+    Render one CSV to one PDF and return the number of labels.
+    """
+    with stage("ingest") as s:
+        cards_data = read_records(csv_path)
+        count("rows_parsed", len(cards_data))
+        s.add(rows=len(cards_data), path=csv_path)
+
+    cache = shared_cache() if cached else None
+    with stage("pdf_export") as s:
+        if jobs == 1:
+            write_pdf(cards_data, pdf_path, cache, optimize)
+        else:
+            write_pdf_parallel(cards_data, pdf_path, jobs, cache, optimize)
+        s.add(
+            cards=len(cards_data),
+            bytes=os.path.getsize(pdf_path),
+            jobs=jobs,
+            **cache_fields(s, cache),
+        )
+    return len(cards_data)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build print-ready gallery label PDFs from CSV files."
+    )
+    parser.add_argument("csv", nargs="+", help="CSV file(s) in the upload format")
+    parser.add_argument(
+        "-o", "--out-dir", help="directory for the PDFs (default: next to each CSV)"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes; 0 uses every core (default: 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="reuse page layouts from earlier runs kept in this directory",
+    )
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="write smaller PDFs, at some extra time per file",
+    )
+    args = parser.parse_args(argv)
+
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or more")
+    jobs = args.jobs or default_jobs()
+    missing = [path for path in args.csv if not os.path.isfile(path)]
+    if missing:
+        parser.error(f"no such file: {', '.join(missing)}")
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+    if args.cache_dir:
+        try:
+            os.makedirs(args.cache_dir, mode=0o700, exist_ok=True)
+            check_private(args.cache_dir)
+        except OSError as exc:
+            parser.error(str(exc))
+        # Read by shared_cache() here and in every worker
+        os.environ[CACHE_DIR_ENV] = args.cache_dir
+    cached = bool(args.cache_dir)
+
+    outputs = [output_path(path, args.out_dir) for path in args.csv]
+    # With --out-dir, a/x.csv and b/x.csv would both write x.pdf
+    seen = {}
+    for path, out in zip(args.csv, outputs):
+        key = os.path.normcase(os.path.abspath(out))
+        if key in seen:
+            parser.error(f"{seen[key]} and {path} would both be written to {out}")
+        seen[key] = path
+    start = time.perf_counter()
+
+    if len(args.csv) > 1 and jobs > 1:
+        # Several files: one file per worker
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=MP_CONTEXT) as pool:
+            counts = list(
+                pool.map(
+                    convert,
+                    args.csv,
+                    outputs,
+                    [1] * len(outputs),
+                    [cached] * len(outputs),
+                    [args.optimize] * len(outputs),
+                )
+            )
+    else:
+        # One file: split its pages across the workers
+        counts = [
+            convert(path, out, jobs, cached, args.optimize)
+            for path, out in zip(args.csv, outputs)
+        ]
+
+    for path, out, labels in zip(args.csv, outputs, counts):
+        print(f"{path} -> {out} ({labels} labels)")
+    print(f"Done in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import functools
+from datetime import datetime as dd
+
+DATE_FORMATS = ("%Y/%m/%d", "%Y/%d/%m", "%d/%m/%Y", "%m/%d/%Y")
+DATE_CACHE_SIZE = 4096
+
+
+def format_date(raw_date):
+    """
+    Convert any date string like '2024/5/20' to '2024/05/20'.
+    If the input is empty or invalid, return an empty string.
+    """
+    if not raw_date:
+        return ""
+
+    # Replace different delimiters with '/'
+    raw_date = raw_date.replace("-", "/").replace(".", "/")
+
+    # Try parsing the date
+    for fmt in DATE_FORMATS:
+        try:
+            parsed = dd.strptime(raw_date, fmt)
+            return parsed.strftime("%Y/%m/%d")  # zero-padded
+        except ValueError:
+            continue
+
+    # fallback: return raw if parsing fails
+    return raw_date
+
+
+class DateNormalizer:
+    """
+    Cached `format_date` for columns that repeat the same dates.
+
+    Formats are tried in DATE_FORMATS order as in `format_date`, but a
+    format is skipped without calling strptime when a field cannot fit
+    it (a year that is not 4 digits, a month over 12), so most values
+    are parsed once. Results always match `format_date`.
+    """
+
+    def __init__(self, maxsize=DATE_CACHE_SIZE):
+        self._cached = functools.lru_cache(maxsize=maxsize)(self._normalize)
+
+    def __call__(self, raw_date):
+        return self._cached(raw_date)
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+    def _normalize(self, raw_date):
+        if not raw_date:
+            return ""
+
+        raw_date = raw_date.replace("-", "/").replace(".", "/")
+        fields = raw_date.split("/")
+        for fmt in DATE_FORMATS:
+            if not _fits(fields, fmt):
+                continue
+            parsed = _strptime(raw_date, fmt)
+            if parsed is not None:
+                return parsed.strftime("%Y/%m/%d")
+
+        return raw_date
+
+    def normalize_series(self, raw_dates):
+        """
+        Normalize a Series of date strings, parsing each distinct value once.
+        """
+        uniques = dict.fromkeys(raw_dates)
+        return raw_dates.map({raw: self(raw) for raw in uniques})
+
+
+def _fits(fields, fmt):
+    # Only rules out what strptime would reject: %Y is exactly 4 digits,
+    # %m 1-12 and %d 1-31. Anything unusual is left to strptime.
+    if len(fields) != 3:
+        return True
+    for field, directive in zip(fields, fmt.split("/")):
+        if not field.isdecimal():
+            continue
+        if directive == "%Y":
+            if len(field) != 4:
+                return False
+        elif len(field) > 2 or not 1 <= int(field) <= (12 if directive == "%m" else 31):
+            return False
+    return True
+
+
+def _strptime(raw_date, fmt):
+    try:
+        return dd.strptime(raw_date, fmt)
+    except ValueError:
+        return None
+
+
+# Shared by every upload in the process
+date_normalizer = DateNormalizer()
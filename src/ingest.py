@@ -0,0 +1,79 @@
+import pandas as pd
+from dates import date_normalizer
+from card_store import FIELDS
+
+# Lines are normalized in blocks of about this many characters
+BLOCK_SIZE = 64 * 1024
+
+
+def normalize_text(text):
+    """
+    Replace every delimiter with ',' and full-width parentheses with
+    half-width ones. None of the patterns span a line break, so any run
+    of whole lines can be normalized on its own.
+    """
+    text = text.replace("，", ",").replace(";", ",").replace("\t", ",").replace(", ", ",")
+    # replace full sized paranthesis
+    return text.replace("（", " (").replace("）", ") ")
+
+
+class NormalizedReader:
+    """
+    Read-only text stream over a CSV file that normalizes blocks of lines
+    as pandas reads them, so the upload is never held as a whole string.
+    """
+
+    def __init__(self, f):
+        self._lines = iter(f)
+        self._buffer = ""
+
+    def _fill(self, size):
+        # Pull whole lines until the buffer holds `size` characters
+        parts = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            block = []
+            block_length = 0
+            for line in self._lines:
+                block.append(line)
+                block_length += len(line)
+                if block_length >= BLOCK_SIZE:
+                    break
+            if not block:
+                break
+            text = normalize_text("".join(block))
+            parts.append(text)
+            length += len(text)
+        self._buffer = "".join(parts)
+
+    def read(self, size=-1):
+        if size is None:
+            size = -1
+        self._fill(size)
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def read_frame(path):
+    """
+    Read an uploaded CSV into a DataFrame of display strings, one column
+    per label field.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        df = pd.read_csv(NormalizedReader(f), delimiter=",", comment="#")
+
+    # Fill missing values with empty string
+    df = df.fillna("")
+
+    columns = {}
+    for field in FIELDS:
+        if field in df.columns:
+            columns[field] = df[field].astype(str)
+        else:
+            columns[field] = pd.Series("", index=df.index, dtype=object)
+
+    columns["date"] = date_normalizer.normalize_series(columns["date"])
+    return pd.DataFrame(columns, index=df.index)
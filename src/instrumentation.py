@@ -0,0 +1,160 @@
+"""
+Timers and counters for the hot paths (CSV ingestion, preview, PDF export).
+
+Off unless GALLERY_LABELS_METRICS=1, in which case every stage logs one
+JSON line to the "gallery_labels.metrics" logger (stderr by default),
+with the counters incremented on its thread while it ran under
+"counters".
+Setting GALLERY_LABELS_PROFILE=<dir> also saves a cProfile dump of each
+stage into <dir>. When both are off, `stage()` returns a shared no-op and
+`count()` returns after one check.
+"""
+
+import os
+import json
+import time
+import logging
+import cProfile
+import threading
+
+METRICS_ENV = "GALLERY_LABELS_METRICS"
+PROFILE_ENV = "GALLERY_LABELS_PROFILE"
+
+ENABLED = os.environ.get(METRICS_ENV, "") not in ("", "0")
+PROFILE_DIR = os.environ.get(PROFILE_ENV) or None
+
+logger = logging.getLogger("gallery_labels.metrics")
+
+_lock = threading.Lock()
+_local = threading.local()
+_stages = {}
+_counters = {}
+
+
+class _NullStage:
+    counters = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, **fields):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    def __init__(self, name):
+        self.name = name
+        self.fields = {}
+        # Counts made on this thread while the stage is open
+        self.counters = {}
+        self._profile = None
+
+    def __enter__(self):
+        # cProfile allows one profiler per thread, so only the outermost
+        # stage on a thread is profiled
+        open_stages = _open_stages()
+        open_stages.append(self)
+        if PROFILE_DIR and len(open_stages) == 1:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._start
+        _open_stages().remove(self)
+
+        if self._profile is not None:
+            self._profile.disable()
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(PROFILE_DIR, f"{self.name}-{stamp}-{os.getpid()}.prof")
+            self._profile.dump_stats(path)
+            self.fields["profile"] = path
+
+        if ENABLED:
+            _record(self.name, elapsed, self.fields, self.counters, failed=exc_type is not None)
+        return False
+
+    def add(self, **fields):
+        """
+        Attach counts (rows parsed, cards rendered, ...) to this stage.
+        """
+        self.fields.update(fields)
+
+
+def stage(name):
+    """
+    Time a block as the stage `name`:
+
+        with stage("ingest") as s:
+            ...
+            s.add(rows=len(df))
+    """
+    if not ENABLED and not PROFILE_DIR:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+def count(name, n=1):
+    """
+    Add `n` to the process-wide counter `name`, and to every stage open
+    on this thread.
+    """
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+    for open_stage in _open_stages():
+        open_stage.counters[name] = open_stage.counters.get(name, 0) + n
+
+
+def snapshot():
+    """
+    Totals since the process started: calls and seconds per stage, and
+    every counter.
+    """
+    with _lock:
+        return {
+            "stages": {name: dict(totals) for name, totals in _stages.items()},
+            "counters": dict(_counters),
+        }
+
+
+def _open_stages():
+    stages = getattr(_local, "stages", None)
+    if stages is None:
+        stages = _local.stages = []
+    return stages
+
+
+def _record(name, elapsed, fields, counters, failed=False):
+    with _lock:
+        totals = _stages.setdefault(name, {"calls": 0, "seconds": 0.0})
+        totals["calls"] += 1
+        totals["seconds"] += elapsed
+
+    event = {
+        "ts": round(time.time(), 3),
+        "pid": os.getpid(),
+        "stage": name,
+        "ms": round(elapsed * 1000, 3),
+        "failed": failed,
+        **fields,
+        "counters": counters,
+    }
+    logger.info(json.dumps(event, ensure_ascii=False))
+
+
+if ENABLED and not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
@@ -0,0 +1,22 @@
+# Page geometry shared by the preview and the PDF, in PDF points. Kept free
+# of reportlab so the app can use it without loading the PDF stack.
+
+# Same derivation as reportlab.lib.units
+inch = 72.0
+cm = inch / 2.54
+mm = cm * 0.1
+
+# reportlab.lib.pagesizes.A4
+PAGE_WIDTH, PAGE_HEIGHT = A4 = (210 * mm, 297 * mm)
+
+CARD_WIDTH = 105 * mm
+CARD_HEIGHT = 74.25 * mm
+
+COLS, ROWS = 2, 4
+CARDS_PER_PAGE = COLS * ROWS
+
+PADDING = 4 * mm
+HEADER_WIDTH = 50 * mm
+
+FONT_SIZE = 14
+LEADING = 28
@@ -0,0 +1,195 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Environment variable naming a directory to keep laid-out pages in
+CACHE_DIR_ENV = "GALLERY_LABELS_CACHE_DIR"
+
+MAX_MEMORY_BYTES = 64 * 1024 * 1024
+MAX_DISK_BYTES = 512 * 1024 * 1024
+
+_shared = None
+
+
+class PageCache:
+    """
+    Laid-out pages as pickled bytes, keyed on a hash of the page's cards
+    plus the layout and assets they were laid out with.
+
+    Pages are kept in memory up to `max_bytes`, evicting the least
+    recently used. With `directory` set they are also written there, so
+    a later process can reuse them; the directory is trimmed to
+    `max_disk_bytes` by oldest access.
+
+    Pages are unpickled when read back, so anyone who can write to
+    `directory` can run code in this process. It is created private to
+    the current user, and one that another user owns or can write to is
+    refused with a PermissionError.
+    """
+
+    def __init__(self, max_bytes=MAX_MEMORY_BYTES, directory=None, max_disk_bytes=MAX_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._pages = OrderedDict()
+        self._size = 0
+        self._disk_size = 0
+        self._lock = threading.Lock()
+
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            check_private(directory)
+            self._disk_size = sum(size for _, size, _ in self._disk_entries())
+
+    @staticmethod
+    def key(page_cards, fingerprint):
+        """
+        Content address of one page: the same cards in the same slots,
+        drawn with the same layout and assets, give the same key.
+        """
+        payload = json.dumps([fingerprint, page_cards], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            data = self._pages.get(key)
+            if data is not None:
+                self._pages.move_to_end(key)
+                self.hits += 1
+                return data
+
+        data = self._read_disk(key)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        with self._lock:
+            self._remember(key, data)
+        self._write_disk(key, data)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "pages": len(self._pages),
+                "bytes": self._size,
+            }
+
+    def _remember(self, key, data):
+        if key in self._pages:
+            self._pages.move_to_end(key)
+            return
+        self._pages[key] = data
+        self._size += len(data)
+        while self._size > self.max_bytes and self._pages:
+            _, evicted = self._pages.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def _read_disk(self, key):
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        # Mark as recently used for trimming; a file trimmed meanwhile or
+        # a read-only directory only costs it its place
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        return data
+
+    def _write_disk(self, key, data):
+        if not self.directory:
+            return
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            # Rewriting a page replaces the old file rather than adding one
+            old_size = os.stat(path).st_size
+        except OSError:
+            old_size = 0
+        # A full disk or missing permissions leave the page in memory only
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._disk_size += len(data) - old_size
+            if self._disk_size > self.max_disk_bytes:
+                self._trim_disk()
+
+    def _disk_entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pickle"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _trim_disk(self):
+        # Drop the least recently used files until back under 90% of the
+        # limit, so trimming does not run again on the very next write
+        entries = sorted(self._disk_entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        self._disk_size = total
+
+
+def check_private(directory):
+    """
+    Raise PermissionError unless `directory` is owned by the current user
+    and no one else can write to it.
+    """
+    # No owners or mode bits to go by on Windows
+    if not hasattr(os, "getuid"):
+        return
+    st = os.stat(directory)
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"page cache directory {directory} is owned by another user")
+    if st.st_mode & 0o022:
+        raise PermissionError(
+            f"page cache directory {directory} is writable by other users; "
+            f"run 'chmod go-w {directory}'"
+        )
+
+
+def shared_cache():
+    """
+    Page cache shared by every session in the process, kept on disk too
+    when GALLERY_LABELS_CACHE_DIR is set.
+    """
+    global _shared
+    if _shared is None:
+        _shared = PageCache(directory=os.environ.get(CACHE_DIR_ENV) or None)
+    return _shared
@@ -0,0 +1,527 @@
+import io
+import os
+import pickle
+import asyncio
+import tempfile
+import threading
+import itertools
+import contextlib
+import collections
+import multiprocessing
+import concurrent.futures
+import reportlab
+from pypdf import PdfWriter
+from pypdf.generic import NameObject
+from concurrent.futures import ProcessPoolExecutor
+from reportlab.lib import colors
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Paragraph
+from reportlab.lib.styles import ParagraphStyle
+from page_cache import PageCache
+from pdf_stream import PdfStream
+from instrumentation import count, stage
+from assets import asset_fingerprint, register_font, draw_header
+from layout import (
+    A4,
+    CARD_HEIGHT,
+    CARD_WIDTH,
+    CARDS_PER_PAGE,
+    COLS,
+    FONT_SIZE,
+    HEADER_WIDTH,
+    LEADING,
+    PADDING,
+    PAGE_HEIGHT,
+    ROWS,
+    mm,
+)
+
+# Largest chunk handed to the download, and how much of an optimized
+# document is kept in memory before spilling to a temp file
+CHUNK_SIZE = 64 * 1024
+SPOOL_SIZE = 8 * 1024 * 1024
+
+# Pages rendered at a time when the download is written as it renders.
+# Each run embeds its own font subset: longer runs make a smaller file,
+# shorter ones send the first page sooner and hold less in memory.
+STREAM_PAGES = 64
+
+# Smaller runs are rendered in-process; shipping them to workers costs
+# more than it saves
+PARALLEL_MIN_PAGES = 16
+
+# Workers are started fresh rather than forked: a fork taken while
+# another thread holds a lock (page cache, assets, logging) leaves that
+# lock held forever in the child, and would copy the page cache too
+MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# Page entries every page shares, moved up to the page tree by
+# `optimize_pdf` so they are written once per document
+INHERITED_KEYS = ("/Resources", "/MediaBox")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def label_style():
+    """
+    Paragraph style used for the text block of every card.
+    """
+    # pdfmetrics.registerFont(UnicodeCIDFont("STSong-Light"))
+    font_name = register_font()
+    return ParagraphStyle(name="Label", fontName=font_name, fontSize=FONT_SIZE, leading=LEADING)
+
+
+def layout_card(content, style):
+    """
+    Build and wrap the text block of one card. The result only depends on
+    the card and the layout, not on the page or document it is drawn in.
+    """
+    size_display = f"{content['height']} cm x {content['width']} cm"
+    comments_text = content.get("comments", "")
+    if not comments_text:
+        # Empty comment -> use white color
+        comment_color = colors.white
+    else:
+        comment_color = colors.black
+
+    text_content = f"""
+    作品名稱: {content['title']}<br/>
+    作品尺寸: {size_display}<br/>
+    創作媒材: {content['medium']}<br/>
+    創作日期: {content.get('date', '')}<br/>
+    <font color="{comment_color.hexval()}">備註\t: {comments_text}</font>
+    """
+
+    paragraph = Paragraph(text_content, style)
+
+    text_width = CARD_WIDTH - 2 * PADDING
+    text_height = CARD_HEIGHT
+
+    paragraph.wrap(text_width, text_height)
+    return paragraph
+
+
+def layout_page(page_cards, style, cache=None, layout=None):
+    """
+    Laid-out text blocks for the cards of one page, from `cache` when
+    the same cards were laid out before. `layout` is the render's
+    `fingerprint()`, taken once for all its pages.
+
+    The cache holds pickled paragraphs rather than finished PDF pages:
+    reportlab numbers font-subset glyphs per document, so drawing
+    commands cannot be copied between documents, but the line breaking
+    that dominates render time can.
+    """
+    if cache is None:
+        return [layout_card(content, style) for content in page_cards]
+
+    key = cache.key(page_cards, layout or fingerprint())
+    data = cache.get(key)
+    if data is not None:
+        count("page_cache_hits")
+        return pickle.loads(data)
+
+    count("page_cache_misses")
+    paragraphs = [layout_card(content, style) for content in page_cards]
+    cache.put(key, pickle.dumps(paragraphs, protocol=pickle.HIGHEST_PROTOCOL))
+    return paragraphs
+
+
+def fingerprint():
+    """
+    Everything besides the cards that changes how a page is laid out,
+    including the ReportLab version that pickled the layout.
+    """
+    layout = [CARD_WIDTH, CARD_HEIGHT, COLS, ROWS, PADDING, HEADER_WIDTH, FONT_SIZE, LEADING]
+    return layout + asset_fingerprint() + [reportlab.Version]
+
+
+def draw_card(c, position, paragraph):
+    """
+    Draw one card in slot `position` (0-7) of the current page.
+    """
+    col = position % COLS
+    row = position // COLS
+
+    x = col * CARD_WIDTH
+    y = PAGE_HEIGHT - ((row + 1) * CARD_HEIGHT)
+
+    # Draw card border
+    c.setLineWidth(0.2)
+    c.rect(x, y, CARD_WIDTH, CARD_HEIGHT)
+
+    # Internal padding
+    cursor_y = y + CARD_HEIGHT - PADDING
+
+    # ---- Header Image ----
+    img_height = draw_header(c, x + (CARD_WIDTH - HEADER_WIDTH) / 2, cursor_y, HEADER_WIDTH)
+    if img_height:
+        # Move cursor below image
+        cursor_y = cursor_y - img_height - 4 * mm
+
+    # ---- Text Content ----
+    paragraph.drawOn(c, x + PADDING, cursor_y - paragraph.height)
+
+
+def draw_cards(c, cards_data, cache=None):
+    """
+    Draw every card onto the canvas, starting a new page every 8 cards.
+    """
+    style = label_style()
+    layout = fingerprint() if cache is not None else None
+
+    for page_cards in split_cards(cards_data):
+        for position, paragraph in enumerate(layout_page(page_cards, style, cache, layout)):
+            draw_card(c, position, paragraph)
+        count("pages_drawn")
+
+        # New page every 8 cards
+        if len(page_cards) == CARDS_PER_PAGE:
+            c.showPage()
+
+
+def write_pdf(cards_data, out, cache=None, optimize=False):
+    """
+    Render the cards as a print-ready A4 PDF into `out` (a path or a
+    binary file object), reusing page layouts from `cache` if given.
+    With `optimize`, the document is passed through `optimize_pdf`,
+    which holds all of it in memory and takes extra time.
+    """
+    if optimize:
+        buffer = io.BytesIO()
+        write_pdf(cards_data, buffer, cache)
+        writer = PdfWriter(clone_from=buffer)
+        optimize_pdf(writer)
+        writer.write(out)
+        return
+
+    c = canvas.Canvas(out, pagesize=A4, pageCompression=1)
+    draw_cards(c, cards_data, cache)
+    c.save()
+
+
+def optimize_pdf(writer):
+    """
+    Shrink a rendered document in place, without changing what any page
+    draws:
+
+    - page contents are stored as plain Flate streams, without the
+      ASCII85 layer ReportLab wraps them in;
+    - the resources and media box every page repeats are stored once on
+      the page tree and inherited, and the empty transition, zero
+      rotation and obsolete ProcSet entries are dropped;
+    - identical objects are stored once.
+
+    The font needs no extra work: ReportLab only embeds the glyphs used.
+    """
+    pages = writer.pages
+    for page in pages:
+        page.compress_content_streams()
+        if "/Trans" in page and not page["/Trans"]:
+            del page["/Trans"]
+        if page.get("/Rotate") == 0:
+            del page["/Rotate"]
+        if "/Resources" in page:
+            page["/Resources"].pop("/ProcSet", None)
+
+    # Only safe to hoist when every page hangs directly off the root
+    tree = writer.root_object["/Pages"]
+    if all(page.raw_get("/Parent") == writer.root_object.raw_get("/Pages") for page in pages):
+        for key in INHERITED_KEYS:
+            values = {repr(page.get(key)) for page in pages}
+            if len(values) == 1 and key in pages[0]:
+                tree[NameObject(key)] = pages[0][key]
+                for page in pages:
+                    del page[key]
+
+    writer.compress_identical_objects()
+
+
+def default_jobs():
+    return os.cpu_count() or 1
+
+
+def shared_pool():
+    """
+    Worker pool shared by every session, started on the first parallel
+    render and sized to the machine.
+    """
+    global _pool
+    # Downloads start it from executor threads, possibly two at once
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=default_jobs(), mp_context=MP_CONTEXT)
+        return _pool
+
+
+def shutdown_pool():
+    """
+    Stop the shared pool's workers, if it was started.
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+def split_cards(cards_data):
+    """
+    The cards of each page, in order.
+    """
+    return [
+        cards_data[start : start + CARDS_PER_PAGE]
+        for start in range(0, len(cards_data), CARDS_PER_PAGE)
+    ]
+
+
+def split_pages(cards_data, parts):
+    """
+    Split the cards into at most `parts` runs of whole pages, so each run
+    lays out exactly as the same pages would in a single document.
+    """
+    pages = -(-len(cards_data) // CARDS_PER_PAGE)
+    pages_per_part = -(-pages // parts)
+    step = pages_per_part * CARDS_PER_PAGE
+    return [cards_data[i : i + step] for i in range(0, len(cards_data), step)]
+
+
+def render_part(cards_data, layouts=None):
+    """
+    Render one run of pages to PDF bytes in a worker process.
+
+    `layouts` holds, for each page, its pickled layout from the caller's
+    cache, or None for a page to lay out here. Returns the PDF and the
+    pickled layouts of the pages laid out here (None for the others), for
+    the caller to cache.
+    """
+    buffer = io.BytesIO()
+    if layouts is None:
+        write_pdf(cards_data, buffer)
+        return buffer.getvalue(), []
+
+    # Hand the caller's layouts to write_pdf through a cache of this run
+    cache = PageCache(max_bytes=float("inf"))
+    layout = fingerprint()
+    keys = [cache.key(page_cards, layout) for page_cards in split_cards(cards_data)]
+    for key, data in zip(keys, layouts):
+        if data is not None:
+            cache.put(key, data)
+
+    write_pdf(cards_data, buffer, cache)
+    fresh = [cache.get(key) if data is None else None for key, data in zip(keys, layouts)]
+    return buffer.getvalue(), fresh
+
+
+def cached_layouts(parts, cache):
+    """
+    Cache keys of the pages of each run in `parts`, and their pickled
+    layouts from `cache` (None for a page not in it), as `render_part`
+    takes them. Both are None per run without a cache.
+    """
+    if cache is None:
+        return [None] * len(parts), [None] * len(parts)
+
+    layout = fingerprint()
+    keys = [[cache.key(page_cards, layout) for page_cards in split_cards(part)] for part in parts]
+    layouts = [[cache.get(key) for key in part_keys] for part_keys in keys]
+    hits = sum(data is not None for part_layouts in layouts for data in part_layouts)
+    count("page_cache_hits", hits)
+    count("page_cache_misses", sum(map(len, keys)) - hits)
+    return keys, layouts
+
+
+def store_layouts(cache, keys, fresh):
+    """
+    Add the layouts a worker made (`render_part`'s second result) to `cache`.
+    """
+    for key, data in zip(keys or (), fresh):
+        if data is not None:
+            cache.put(key, data)
+
+
+def render_runs(cards_data, jobs=1, cache=None):
+    """
+    Render the cards in runs of STREAM_PAGES pages and yield each run's
+    PDF bytes in order, as soon as it and the runs before it are done.
+
+    With `jobs` other than 1, runs are rendered in worker processes (the
+    shared pool for `jobs=None`), with only as many in flight as there
+    are workers, so finished runs do not pile up ahead of the reader.
+    """
+    step = STREAM_PAGES * CARDS_PER_PAGE
+    runs = [cards_data[i : i + step] for i in range(0, len(cards_data), step)]
+    pages = -(-len(cards_data) // CARDS_PER_PAGE)
+
+    if jobs == 1 or pages < PARALLEL_MIN_PAGES:
+        for run in runs:
+            buffer = io.BytesIO()
+            write_pdf(run, buffer, cache)
+            yield buffer.getvalue()
+        return
+
+    with contextlib.ExitStack() as stack:
+        if jobs is None:
+            pool, workers = shared_pool(), default_jobs()
+        else:
+            pool = stack.enter_context(
+                ProcessPoolExecutor(max_workers=jobs, mp_context=MP_CONTEXT)
+            )
+            workers = jobs
+
+        pending = collections.deque()
+        # Drop the runs still queued if the reader stops early
+        stack.callback(lambda: [future.cancel() for future, _ in pending])
+
+        runs = iter(runs)
+        while True:
+            for run in itertools.islice(runs, workers - len(pending)):
+                (keys,), (layouts,) = cached_layouts([run], cache)
+                pending.append((pool.submit(render_part, run, layouts), keys))
+            if not pending:
+                break
+            future, keys = pending.popleft()
+            data, fresh = future.result()
+            store_layouts(cache, keys, fresh)
+            yield data
+
+
+def write_pdf_parallel(cards_data, out, jobs=None, cache=None, optimize=False):
+    """
+    Render the cards across worker processes and merge the page runs
+    into a single PDF, page for page the same as `write_pdf`.
+
+    With `jobs=None` the shared pool is used; otherwise a pool of `jobs`
+    workers is started for this call. Pages found in `cache` are sent to
+    the workers already laid out; the pages they lay out are added to it.
+
+    With `optimize` the document is rendered in this process instead:
+    every run would embed its own font subset, and a single subset for
+    the whole card set saves more than the workers would.
+    """
+    parts_count = jobs or default_jobs()
+    pages = -(-len(cards_data) // CARDS_PER_PAGE)
+    if optimize or parts_count < 2 or pages < PARALLEL_MIN_PAGES:
+        write_pdf(cards_data, out, cache, optimize)
+        return
+
+    parts = split_pages(cards_data, parts_count)
+    keys, layouts = cached_layouts(parts, cache)
+
+    if jobs is None:
+        rendered = list(shared_pool().map(render_part, parts, layouts))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=MP_CONTEXT) as pool:
+            rendered = list(pool.map(render_part, parts, layouts))
+
+    writer = PdfWriter()
+    for part_keys, (part, fresh) in zip(keys, rendered):
+        writer.append(io.BytesIO(part))
+        store_layouts(cache, part_keys, fresh)
+
+    # Each run carries its own copy of the header image; keep one
+    writer.compress_identical_objects()
+    writer.write(out)
+
+
+def spool_pdf(cards_data, jobs=1, cache=None, optimize=False):
+    """
+    Render the cards into a spooled temp file, rewound and ready to read.
+
+    For documents that must be complete before they can be written, as
+    optimized ones are; `iter_pdf` streams the others.
+    """
+    f = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    with stage("pdf_export") as s:
+        if jobs == 1:
+            write_pdf(cards_data, f, cache, optimize)
+        else:
+            write_pdf_parallel(cards_data, f, jobs, cache, optimize)
+        s.add(
+            cards=len(cards_data),
+            pages=-(-len(cards_data) // CARDS_PER_PAGE),
+            bytes=f.tell(),
+            optimize=optimize,
+            **cache_fields(s, cache),
+        )
+    f.seek(0)
+    return f
+
+
+def cache_fields(s, cache):
+    """
+    Page cache hits and misses counted in stage `s`, as stage fields.
+    """
+    if cache is None:
+        return {}
+    return {
+        "cache_hits": s.counters.get("page_cache_hits", 0),
+        "cache_misses": s.counters.get("page_cache_misses", 0),
+    }
+
+
+def iter_chunks(f, chunk_size=CHUNK_SIZE):
+    """
+    Yield the contents of `f` in `chunk_size` pieces, closing it at the end.
+    """
+    with f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def iter_pdf(cards_data, chunk_size=CHUNK_SIZE, jobs=1, cache=None, optimize=False):
+    """
+    Yield the PDF in pieces of at most `chunk_size` as it is rendered.
+
+    Pages are rendered STREAM_PAGES at a time and each run is written
+    out before the next one is started, so the first bytes leave after
+    the first run and memory stays bounded by a few runs, whatever the
+    number of cards. The pages are the same as from `write_pdf`.
+
+    With `optimize` the whole document is rewritten once rendered
+    (see `optimize_pdf`), so nothing is yielded before it is done.
+    """
+    if optimize:
+        yield from iter_chunks(spool_pdf(cards_data, jobs, cache, optimize), chunk_size)
+        return
+
+    stream = PdfStream()
+    # The stage also counts the time spent waiting on the reader
+    with stage("pdf_export") as s:
+        for data in stream.join(render_runs(cards_data, jobs, cache)):
+            for start in range(0, len(data), chunk_size):
+                yield data[start : start + chunk_size]
+        s.add(
+            cards=len(cards_data),
+            pages=stream.pages,
+            bytes=stream.position,
+            optimize=optimize,
+            **cache_fields(s, cache),
+        )
+
+
+async def aiter_pdf(cards_data, chunk_size=CHUNK_SIZE, jobs=None, cache=None, optimize=False):
+    """
+    Like `iter_pdf`, but render on a background thread (and, for large
+    runs, the shared worker pool) so the event loop keeps serving other
+    sessions.
+    """
+    loop = asyncio.get_running_loop()
+    chunks = iter_pdf(cards_data, chunk_size, jobs, cache, optimize)
+    # One thread per download: the generator, and the metrics stage
+    # open inside it, always resume on the thread they started on
+    thread = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        while True:
+            chunk = await loop.run_in_executor(thread, next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        # Queued behind any render still running if the download stopped
+        await loop.run_in_executor(thread, chunks.close)
+        thread.shutdown(wait=False)
@@ -0,0 +1,215 @@
+import io
+import re
+import hashlib
+from pypdf import PdfReader
+from pypdf.generic import (
+    ArrayObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    StreamObject,
+)
+
+HEADER = b"%PDF-1.4\n%\x93\x8c\x8b\x9e\n"
+
+# Object numbers of the catalog and the page tree, written last
+CATALOG = 1
+PAGE_TREE = 2
+
+# "AAAAAA+Font": the tag ReportLab gives each font subset
+SUBSET_NAME = re.compile(r"^/[A-Z]{6}\+")
+FONT_NAME_KEYS = ("/BaseFont", "/FontName")
+
+# Page entries a page may take from its page tree instead of its own dict
+INHERITABLE_KEYS = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
+
+class PdfStream:
+    """
+    Join separately rendered PDFs (runs of pages) into one document that
+    is written out as it grows.
+
+    `join()` yields the bytes of the document run by run (as do
+    `header()`, then `add()` for each run and `finish()`), so a run can
+    be sent as soon as it is rendered and then dropped. Only the object offsets and page numbers
+    are kept until `finish()` writes the page tree and the cross
+    reference table.
+
+    Objects repeated from run to run (the header image) are written
+    once. Each run keeps its own font subsets, renamed so no two subsets
+    in the document share a name.
+    """
+
+    def __init__(self):
+        self.position = 0
+        self.pages = 0
+        # Offset of each object, by object number - 1
+        self._offsets = [None, None]
+        self._kids = []
+        # SHA-256 of an object as written -> its object number
+        self._written = {}
+        self._subsets = {}
+        self._run = 0
+
+    def join(self, runs):
+        """
+        Yield the whole document for the PDFs in `runs`, in order.
+        """
+        # The header goes out with the first page rather than on its own
+        pending = self.header()
+        for pdf in runs:
+            yield pending + self.add(pdf)
+            pending = b""
+        yield pending + self.finish()
+
+    def header(self):
+        return self._emit(HEADER)
+
+    def add(self, pdf):
+        """
+        Append the pages of `pdf` (bytes of a complete document) and
+        return the bytes to write.
+        """
+        self._run += 1
+        reader = PdfReader(io.BytesIO(pdf))
+        out = io.BytesIO()
+        numbers = {}
+
+        for page in reader.pages:
+            copy = DictionaryObject()
+            for key, value in page_entries(page).items():
+                copy[NameObject(key)] = self._copy(value, numbers, out)
+            copy[NameObject("/Parent")] = IndirectObject(PAGE_TREE, 0, None)
+            self._kids.append(self._write(copy, out, self._reserve()))
+            self.pages += 1
+
+        return self._emit(out.getvalue())
+
+    def finish(self):
+        """
+        Write the page tree, the catalog, the cross reference table and
+        the trailer, and return their bytes.
+        """
+        out = io.BytesIO()
+        tree = DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Pages"),
+                NameObject("/Count"): NumberObject(len(self._kids)),
+                NameObject("/Kids"): ArrayObject(
+                    IndirectObject(number, 0, None) for number in self._kids
+                ),
+            }
+        )
+        catalog = DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Catalog"),
+                NameObject("/Pages"): IndirectObject(PAGE_TREE, 0, None),
+            }
+        )
+        self._write(tree, out, PAGE_TREE)
+        self._write(catalog, out, CATALOG)
+
+        xref = self.position + out.tell()
+        size = len(self._offsets) + 1
+        out.write(f"xref\n0 {size}\n0000000000 65535 f \n".encode())
+        for offset in self._offsets:
+            out.write(f"{offset:010d} 00000 n \n".encode())
+        out.write(f"trailer\n<< /Size {size} /Root {CATALOG} 0 R >>\n".encode())
+        out.write(f"startxref\n{xref}\n%%EOF\n".encode())
+        return self._emit(out.getvalue())
+
+    def _copy(self, obj, numbers, out):
+        # Copy `obj` with its references renumbered, writing the objects
+        # it refers to on first sight. `numbers` maps the run's object
+        # ids to ours; None marks one being copied, to break cycles.
+        if isinstance(obj, IndirectObject):
+            ref = obj.idnum
+            if ref not in numbers:
+                numbers[ref] = None
+                copy = self._copy(obj.get_object(), numbers, out)
+                # Reserved meanwhile if it refers back to itself
+                numbers[ref] = self._write(copy, out, numbers[ref])
+            elif numbers[ref] is None:
+                numbers[ref] = self._reserve()
+            return IndirectObject(numbers[ref], 0, None)
+
+        if isinstance(obj, StreamObject):
+            copy = StreamObject()
+            # Keep the data as stored, still compressed
+            copy._data = obj._data
+            for key, value in obj.items():
+                if key != "/Length":
+                    copy[NameObject(key)] = self._copy(value, numbers, out)
+            return copy
+
+        if isinstance(obj, DictionaryObject):
+            copy = DictionaryObject()
+            for key, value in obj.items():
+                if key in FONT_NAME_KEYS and isinstance(value, NameObject) and SUBSET_NAME.match(value):
+                    value = self._subset_name(value)
+                copy[NameObject(key)] = self._copy(value, numbers, out)
+            return copy
+
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self._copy(item, numbers, out) for item in obj)
+
+        return obj
+
+    def _subset_name(self, name):
+        # The same tag in different runs names different glyph sets
+        key = (self._run, name[1:7])
+        tag = self._subsets.get(key)
+        if tag is None:
+            n = len(self._subsets)
+            tag = ""
+            for _ in range(6):
+                n, letter = divmod(n, 26)
+                tag = chr(ord("A") + letter) + tag
+            self._subsets[key] = tag
+        return NameObject(f"/{tag}{name[7:]}")
+
+    def _reserve(self):
+        self._offsets.append(None)
+        return len(self._offsets)
+
+    def _write(self, obj, out, number=None):
+        data = io.BytesIO()
+        obj.write_to_stream(data)
+        data = data.getvalue()
+
+        # Objects with a number of their own (pages, the page tree, those
+        # referred to before they were written) are never shared
+        if number is None:
+            digest = hashlib.sha256(data).digest()
+            number = self._written.get(digest)
+            if number is not None:
+                return number
+            number = self._reserve()
+            self._written[digest] = number
+
+        self._offsets[number - 1] = self.position + out.tell()
+        out.write(f"{number} 0 obj\n".encode())
+        out.write(data)
+        out.write(b"\nendobj\n")
+        return number
+
+    def _emit(self, data):
+        self.position += len(data)
+        return data
+
+
+def page_entries(page):
+    """
+    The entries of `page` besides /Parent, including those it inherits
+    from its page tree, so it can be moved to another tree.
+    """
+    entries = {key: value for key, value in page.items() if key != "/Parent"}
+    node = page.get("/Parent")
+    while node is not None:
+        node = node.get_object()
+        for key in INHERITABLE_KEYS:
+            if key not in entries and key in node:
+                entries[key] = node.raw_get(key)
+        node = node.get("/Parent")
+    return entries
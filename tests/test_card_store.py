@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from card_store import FIELDS, CardStore
+
+
+def card(n):
+    return {field: f"{field}-{n}" for field in FIELDS}
+
+
+def test_add_fills_missing_fields():
+    cards = CardStore()
+    change = cards.add({"title": "Untitled"}, count=2)
+
+    assert len(change.added) == 2
+    assert cards.get(change.added[0]) == {**dict.fromkeys(FIELDS, ""), "title": "Untitled"}
+
+
+def test_add_columns_rejects_ragged_columns():
+    cards = CardStore()
+    cards.add(card(0))
+
+    with pytest.raises(ValueError):
+        cards.add_columns({"title": ["a", "b"], "height": ["1"]})
+
+    assert len(cards) == 1
+    assert cards.records() == [card(0)]
+
+
+def test_remove_ignores_unknown_ids():
+    cards = CardStore()
+    (cid,) = cards.add(card(0)).added
+
+    change = cards.remove("missing", cid, cid)
+
+    assert change.removed == [cid]
+    assert len(cards) == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_reference(seed):
+    # Random adds, removes and page reads against a plain dict, which
+    # keeps insertion order the way the store should
+    rng = random.Random(seed)
+    cards = CardStore()
+    reference = {}
+    version = 0
+    n = 0
+
+    for _ in range(200):
+        action = rng.random()
+        if action < 0.4 or not reference:
+            count = rng.randint(1, 20)
+            if rng.random() < 0.5:
+                change = cards.add(card(n), count=count)
+                new = [card(n)] * count
+            else:
+                new = [card(n + i) for i in range(count)]
+                change = cards.add_columns({field: [c[field] for c in new] for field in FIELDS})
+            n += count
+            assert len(change.added) == count and not change.removed
+            assert not set(change.added) & set(reference)
+            reference.update(zip(change.added, new))
+        else:
+            ids = rng.sample(list(reference), rng.randint(1, min(len(reference), 30)))
+            change = cards.remove(*ids)
+            assert change.removed == ids and not change.added
+            for cid in ids:
+                del reference[cid]
+
+        version += 1
+        assert change.version == version
+
+        ids = list(reference)
+        size = rng.choice([1, 8, 13])
+        index = rng.randint(0, len(ids) // size + 1)
+        assert cards.page(index, size) == ids[index * size : (index + 1) * size]
+
+        assert len(cards) == len(reference)
+        assert list(cards) == ids
+        assert list(cards.column("title")) == [(cid, c["title"]) for cid, c in reference.items()]
+        assert cards.records() == list(reference.values())
+        assert all(cid in cards for cid in ids)
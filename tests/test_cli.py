@@ -0,0 +1,29 @@
+import pytest
+
+cli = pytest.importorskip("cli")
+
+
+@pytest.fixture
+def csvs(tmp_path):
+    paths = []
+    for name in ("a", "b"):
+        path = tmp_path / name / "x.csv"
+        path.parent.mkdir()
+        path.write_text("title,height,width,medium,date,comments\n", encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_same_output_twice_is_refused(csvs, tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        cli.main([*csvs, "--out-dir", str(tmp_path / "pdfs")])
+
+    assert "would both be written to" in capsys.readouterr().err
+    assert not (tmp_path / "pdfs" / "x.pdf").exists()
+
+
+def test_negative_jobs_are_refused(csvs, capsys):
+    with pytest.raises(SystemExit):
+        cli.main([csvs[0], "--jobs", "-1"])
+
+    assert "--jobs" in capsys.readouterr().err
@@ -0,0 +1,53 @@
+import pytest
+
+from dates import DateNormalizer, format_date
+
+# Fields strptime accepts or rejects at the edges of each format
+CASES = [
+    "",
+    "2024/05/20",
+    "2024-5-2",
+    "2024.05.20",
+    "2024/20/05",
+    "20/05/2024",
+    "05/20/2024",
+    "2024/02/30",
+    "2024/00/05",
+    "2024/13/05",
+    "2024/05/00",
+    "2024/05/32",
+    "2024/32/05",
+    "00/00/2024",
+    "13/13/2024",
+    "32/01/2024",
+    "024/05/20",
+    "24/05/20",
+    "20240/05/20",
+    "2024/005/20",
+    "2024/05/020",
+    "２０２４/05/20",
+    "2024/０５/２０",
+    " 5/05/2024",
+    "2024/05/ 5",
+    "2024/ 5/20",
+    " 2024/05/20",
+    "2024/05/20 ",
+    "2024/05",
+    "05/2024",
+    "2024/05/20/01",
+    "1/2/3/2024",
+    "2024年05月20日",
+    "not a date",
+]
+
+
+@pytest.mark.parametrize("raw", CASES)
+def test_matches_format_date(raw):
+    assert DateNormalizer()(raw) == format_date(raw)
+
+
+def test_normalize_series_matches_format_date():
+    pd = pytest.importorskip("pandas")
+    raw = pd.Series(CASES * 3)
+
+    assert DateNormalizer().normalize_series(raw).tolist() == raw.map(format_date).tolist()
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+import ingest
+from ingest import NormalizedReader, normalize_text
+
+TEXT = "".join(
+    f"標題（{i}）{sep}{i}{sep}{i * 2}{sep}油彩{sep}2024/01/{i % 28 + 1:02d}{sep}\n"
+    for i, sep in zip(range(200), [",", "，", ";", "\t", ", "] * 40)
+)
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 100, 64 * 1024])
+@pytest.mark.parametrize("read_size", [-1, 1, 5, 333])
+def test_reads_same_text_across_blocks(monkeypatch, block_size, read_size):
+    monkeypatch.setattr(ingest, "BLOCK_SIZE", block_size)
+    reader = NormalizedReader(io.StringIO(TEXT))
+
+    parts = []
+    while True:
+        data = reader.read(read_size)
+        if not data:
+            break
+        assert read_size < 0 or len(data) <= read_size
+        parts.append(data)
+
+    assert "".join(parts) == normalize_text(TEXT)
+
+
+def test_read_after_end_is_empty():
+    reader = NormalizedReader(io.StringIO("a;b\n"))
+
+    assert reader.read() == "a,b\n"
+    assert reader.read() == ""
+    assert reader.read(10) == ""
@@ -0,0 +1,42 @@
+import json
+import logging
+
+import pytest
+
+import instrumentation
+from instrumentation import count, stage
+
+
+@pytest.fixture
+def events(monkeypatch, caplog):
+    monkeypatch.setattr(instrumentation, "ENABLED", True)
+    monkeypatch.setattr(instrumentation.logger, "propagate", True)
+    caplog.set_level(logging.INFO, logger=instrumentation.logger.name)
+
+    def logged():
+        return [json.loads(record.getMessage()) for record in caplog.records]
+
+    return logged
+
+
+def test_stage_reports_its_counters(events):
+    count("pages_drawn")
+    with stage("outer") as outer:
+        count("pages_drawn", 2)
+        with stage("inner"):
+            count("page_cache_hits")
+        outer.add(cards=3)
+
+    inner_event, outer_event = events()
+    assert inner_event["stage"] == "inner"
+    assert inner_event["counters"] == {"page_cache_hits": 1}
+    assert outer_event["cards"] == 3
+    assert outer_event["counters"] == {"pages_drawn": 2, "page_cache_hits": 1}
+
+
+def test_counts_outside_stages_only_reach_totals(events):
+    before = instrumentation.snapshot()["counters"].get("rows_parsed", 0)
+    count("rows_parsed", 5)
+
+    assert events() == []
+    assert instrumentation.snapshot()["counters"]["rows_parsed"] == before + 5
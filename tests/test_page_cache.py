@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from page_cache import PageCache
+
+
+def test_memory_evicts_least_recently_used():
+    cache = PageCache(max_bytes=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"
+
+    # Over the limit: "b" is now the least recently used
+    cache.put("c", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.stats() == {"hits": 3, "misses": 1, "pages": 2, "bytes": 8}
+
+
+def test_page_larger_than_memory_limit_is_not_kept():
+    cache = PageCache(max_bytes=4)
+    cache.put("a", b"aaaaa")
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_disk_survives_a_new_cache(tmp_path):
+    PageCache(directory=tmp_path).put("a", b"aaaa")
+
+    cache = PageCache(max_bytes=0, directory=tmp_path)
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("b") is None
+
+
+def test_disk_trims_least_recently_used(tmp_path):
+    cache = PageCache(max_bytes=0, directory=tmp_path, max_disk_bytes=100)
+    for i, key in enumerate("abc"):
+        cache.put(key, bytes(30))
+        os.utime(tmp_path / f"{key}.pickle", (i, i))
+    # Reading "a" makes it the most recently used
+    assert cache.get("a") is not None
+
+    # 120 bytes: trimmed back to 90, oldest first
+    cache.put("d", bytes(30))
+
+    assert sorted(os.listdir(tmp_path)) == ["a.pickle", "c.pickle", "d.pickle"]
+    assert cache._disk_size == 90
+
+
+def test_rewriting_a_page_does_not_grow_disk_size(tmp_path):
+    cache = PageCache(directory=tmp_path, max_disk_bytes=100)
+    for _ in range(5):
+        cache.put("a", bytes(30))
+
+    assert cache._disk_size == 30
+    assert os.listdir(tmp_path) == ["a.pickle"]
+
+
+def test_disk_errors_are_misses(tmp_path):
+    directory = tmp_path / "cache"
+    cache = PageCache(max_bytes=0, directory=directory)
+    directory.rmdir()
+
+    cache.put("a", b"aaaa")
+
+    assert cache.get("a") is None
+    assert cache._disk_size == 0
+
+
+def test_disk_directory_is_private(tmp_path):
+    directory = tmp_path / "cache"
+    PageCache(directory=directory)
+
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="no mode bits")
+def test_shared_directory_is_refused(tmp_path):
+    tmp_path.chmod(0o777)
+
+    with pytest.raises(PermissionError):
+        PageCache(directory=tmp_path)
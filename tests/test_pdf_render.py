@@ -0,0 +1,88 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import assets
+import pdf_render
+
+pypdf = pytest.importorskip("pypdf")
+
+# The label font is not in the repository
+pytestmark = pytest.mark.skipif(
+    not os.path.exists(assets.font_path), reason="label font not installed"
+)
+
+
+def make_cards(n):
+    return [
+        {
+            "title": f"Untitled {i}",
+            "height": str(10 + i),
+            "width": "40",
+            "medium": "Oil on canvas",
+            "date": "2024/05/20",
+            "comments": "Private collection" if i % 3 else "",
+        }
+        for i in range(n)
+    ]
+
+
+def page_texts(data):
+    return [page.extract_text() for page in pypdf.PdfReader(io.BytesIO(data), strict=True).pages]
+
+
+@pytest.fixture
+def serial():
+    def render(cards_data):
+        buffer = io.BytesIO()
+        pdf_render.write_pdf(cards_data, buffer)
+        return page_texts(buffer.getvalue())
+
+    return render
+
+
+@pytest.mark.parametrize("labels", [1, 8, 41])
+def test_streamed_pdf_matches_serial(monkeypatch, serial, labels):
+    monkeypatch.setattr(pdf_render, "STREAM_PAGES", 2)
+    cards_data = make_cards(labels)
+
+    chunks = list(pdf_render.iter_pdf(cards_data, chunk_size=1000))
+
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    data = b"".join(chunks)
+    assert page_texts(data) == serial(cards_data)
+    # One header image for the whole document, not one per run
+    assert data.count(b"/Subtype /Image") == 1
+
+
+@pytest.mark.parametrize("jobs", [2, 3])
+def test_parallel_pdf_matches_serial(serial, jobs):
+    # Enough pages to be split across the workers
+    cards_data = make_cards(pdf_render.PARALLEL_MIN_PAGES * pdf_render.CARDS_PER_PAGE + 5)
+
+    buffer = io.BytesIO()
+    pdf_render.write_pdf_parallel(cards_data, buffer, jobs)
+
+    assert page_texts(buffer.getvalue()) == serial(cards_data)
+
+
+def test_shared_pool_is_started_once(monkeypatch):
+    monkeypatch.setattr(pdf_render, "ProcessPoolExecutor", lambda **kwargs: object())
+    monkeypatch.setattr(pdf_render, "_pool", None)
+
+    with ThreadPoolExecutor(max_workers=8) as threads:
+        pools = list(threads.map(lambda _: pdf_render.shared_pool(), range(32)))
+
+    assert len({id(pool) for pool in pools}) == 1
+
+
+def test_optimized_pdf_has_one_font_subset(serial):
+    cards_data = make_cards(pdf_render.PARALLEL_MIN_PAGES * pdf_render.CARDS_PER_PAGE)
+
+    buffer = io.BytesIO()
+    pdf_render.write_pdf_parallel(cards_data, buffer, jobs=3, optimize=True)
+
+    assert buffer.getvalue().count(b"/FontFile2") == 1
+    assert page_texts(buffer.getvalue()) == serial(cards_data)